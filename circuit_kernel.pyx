@@ -0,0 +1,295 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled version of main._search_kernel.
+
+Build it in place with ``cythonize -i circuit_kernel.pyx``; main.py falls back
+to the pure-Python kernel when the extension is not available.
+"""
+from libc.stdlib cimport calloc, malloc, realloc, free
+from libc.math cimport fabs
+from libc.limits cimport LONG_MAX
+
+cdef struct Hit:
+    long components     # 0 unless ranking by component count
+    double deviation
+    long order          # position in the search, so ties keep the first hit found
+    Py_ssize_t slot     # index of the hit's Python tuple in the payload list
+
+cdef struct Context:
+    int slots
+    int members
+    int max_branches
+    double target
+    double lower
+    double upper
+    double *resistances
+    long *sizes
+    long *used          # members x slots, row-major
+    long *limits
+    long *usage
+    int *group
+    bint prioritize
+    long max_components
+    Py_ssize_t max_results
+    Py_ssize_t held
+    Py_ssize_t capacity
+    long found
+    Hit *heap           # max-heap of the best hits, worst on top
+
+cdef int _bisect_left(double *values, int length, double x):
+    """Same as bisect.bisect_left on a sorted C array"""
+    cdef int lo = 0
+    cdef int hi = length
+    cdef int mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if values[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+cdef inline bint _ranks_after(Hit *a, Hit *b):
+    """Whether hit a ranks after hit b"""
+    if a.components != b.components:
+        return a.components > b.components
+    if a.deviation != b.deviation:
+        return a.deviation > b.deviation
+    return a.order > b.order
+
+cdef void _sift_up(Hit *heap, Py_ssize_t i):
+    cdef Py_ssize_t parent
+    cdef Hit hit = heap[i]
+    while i > 0:
+        parent = (i - 1) // 2
+        if not _ranks_after(&hit, &heap[parent]):
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = hit
+
+cdef void _sift_down(Hit *heap, Py_ssize_t length, Py_ssize_t i):
+    cdef Py_ssize_t child
+    cdef Hit hit = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= length:
+            break
+        if child + 1 < length and _ranks_after(&heap[child + 1], &heap[child]):
+            child += 1
+        if not _ranks_after(&heap[child], &hit):
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = hit
+
+cdef void _record(Context *ctx, double total_r, long components, int depth,
+                  list payload, list member_used) except *:
+    """Keep a hit if it ranks among the best max_results so far"""
+    cdef Hit hit
+    cdef Hit *grown
+    cdef int i
+    hit.components = components if ctx.prioritize else 0
+    hit.deviation = fabs(total_r - ctx.target)
+    hit.order = ctx.found
+    ctx.found += 1
+
+    if ctx.held == ctx.max_results:
+        # A later hit only displaces one that ranks strictly worse
+        if not _ranks_after(&ctx.heap[0], &hit):
+            return
+        hit.slot = ctx.heap[0].slot
+    else:
+        if ctx.held == ctx.capacity:
+            ctx.capacity = min(2 * ctx.capacity, ctx.max_results)
+            grown = <Hit *>realloc(ctx.heap, ctx.capacity * sizeof(Hit))
+            if grown == NULL:
+                raise MemoryError()
+            ctx.heap = grown
+        hit.slot = ctx.held
+        payload.append(None)
+
+    payload[hit.slot] = (total_r, components, tuple([member_used[ctx.group[i]] for i in range(depth)]))
+    if ctx.held == ctx.max_results:
+        ctx.heap[0] = hit
+        _sift_down(ctx.heap, ctx.held, 0)
+    else:
+        ctx.heap[ctx.held] = hit
+        _sift_up(ctx.heap, ctx.held)
+        ctx.held += 1
+
+    if ctx.held == ctx.max_results:
+        # Nothing worse than the current worst can make it in any more, so the
+        # search window narrows to what can still beat it
+        if ctx.prioritize:
+            ctx.max_components = ctx.heap[0].components
+        else:
+            ctx.lower = ctx.target - ctx.heap[0].deviation
+            ctx.upper = ctx.target + ctx.heap[0].deviation
+
+cdef void _extend(Context *ctx, int start, int depth, double inverse, long components,
+                  list payload, list member_used) except *:
+    """Add branches in ascending resistance order so each group is visited once"""
+    cdef int remaining = ctx.max_branches - depth
+    cdef int index, slot, following
+    cdef double headroom, resistance, total_inverse, total_r, smallest, slack, gap
+    cdef long total_components
+    cdef long *branch
+    cdef bint fits
+
+    if inverse != 0 and ctx.lower > 0:
+        # Skip straight past branches that would pull the group below the window
+        headroom = 1 / ctx.lower - inverse
+        if headroom <= 0:
+            return
+        start = max(start, _bisect_left(ctx.resistances, ctx.members, (1 - 1e-12) / headroom))
+
+    for index in range(start, ctx.members):
+        resistance = ctx.resistances[index]
+        total_inverse = inverse + 1 / resistance
+        # Later branches are larger, so if even the best completion
+        # of this group stays above the window, so do all the rest
+        if total_inverse + remaining / resistance < 1 / ctx.upper:
+            break
+        total_r = 1 / total_inverse
+        if total_r < ctx.lower:
+            continue
+        # Components only grow as the group is extended
+        total_components = components + ctx.sizes[index]
+        if total_components > ctx.max_components:
+            continue
+
+        branch = ctx.used + index * ctx.slots
+        fits = True
+        for slot in range(ctx.slots):
+            if ctx.usage[slot] + branch[slot] > ctx.limits[slot]:
+                fits = False
+                break
+        if not fits:
+            continue
+
+        ctx.group[depth - 1] = index
+        if total_r <= ctx.upper:
+            _record(ctx, total_r, total_components, depth, payload, member_used)
+        if remaining and ctx.lower < total_r:
+            # Only descend if some branch is large enough to keep the group
+            # above the window yet small enough to bring it down into it
+            smallest = resistance
+            if ctx.lower > 0:
+                gap = 1 / ctx.lower - total_inverse
+                if gap <= 0:
+                    # Already on the lower edge, so any further branch drops below it
+                    continue
+                smallest = max(smallest, (1 - 1e-12) / gap)
+            following = _bisect_left(ctx.resistances, ctx.members, smallest)
+            slack = 1 / ctx.upper - total_inverse
+            if following < ctx.members and (
+                    slack <= 0 or ctx.resistances[following] * slack <= remaining * (1 + 1e-12)):
+                for slot in range(ctx.slots):
+                    ctx.usage[slot] += branch[slot]
+                _extend(ctx, index, depth + 1, total_inverse, total_components, payload, member_used)
+                for slot in range(ctx.slots):
+                    ctx.usage[slot] -= branch[slot]
+
+cpdef list search(double[::1] values, long[::1] counts, double target, double tolerance,
+                  int max_branches, Py_ssize_t max_results, bint prioritize_fewer_components=False):
+    """
+    Find the best series and parallel circuits within tolerance of the target.
+
+    Returns the same best-first (resistance, component_count, branches) hits
+    as main._search_kernel.
+    """
+    cdef Context ctx
+    cdef int slots = values.shape[0]
+    cdef int slot, index
+    cdef Py_ssize_t i
+    cdef long *digits
+    cdef double resistance
+    cdef list entries = []
+    cdef list payload = []
+    cdef list member_used
+
+    ctx.target = target
+    ctx.lower = target - tolerance
+    ctx.upper = target + tolerance
+    if ctx.upper <= 0 or slots == 0 or max_branches < 1 or max_results <= 0:
+        return []
+
+    # Every series branch, as the number of resistors of each value it uses
+    digits = <long *>calloc(slots, sizeof(long))
+    if digits == NULL:
+        raise MemoryError()
+    try:
+        while True:
+            slot = 0
+            while slot < slots:
+                if digits[slot] < counts[slot]:
+                    digits[slot] += 1
+                    break
+                digits[slot] = 0
+                slot += 1
+            if slot == slots:
+                break
+            resistance = 0.0
+            for slot in range(slots):
+                resistance += digits[slot] * values[slot]
+            # A parallel circuit is always below its smallest branch, so branches
+            # under the lower bound can never take part in a match
+            if resistance >= ctx.lower:
+                entries.append((resistance, tuple([digits[slot] for slot in range(slots)])))
+    finally:
+        free(digits)
+
+    entries.sort()
+    member_used = [used for _, used in entries]
+
+    ctx.slots = slots
+    ctx.members = len(entries)
+    ctx.max_branches = max_branches
+    ctx.prioritize = prioritize_fewer_components
+    ctx.max_components = LONG_MAX
+    ctx.max_results = max_results
+    ctx.held = 0
+    ctx.capacity = min(max_results, 64)
+    ctx.found = 0
+    ctx.resistances = <double *>malloc(max(ctx.members, 1) * sizeof(double))
+    ctx.sizes = <long *>malloc(max(ctx.members, 1) * sizeof(long))
+    ctx.used = <long *>malloc(max(ctx.members, 1) * slots * sizeof(long))
+    ctx.limits = <long *>malloc(slots * sizeof(long))
+    ctx.usage = <long *>calloc(slots, sizeof(long))
+    ctx.group = <int *>malloc(max_branches * sizeof(int))
+    ctx.heap = <Hit *>malloc(ctx.capacity * sizeof(Hit))
+    try:
+        if (ctx.resistances == NULL or ctx.sizes == NULL or ctx.used == NULL or ctx.limits == NULL
+                or ctx.usage == NULL or ctx.group == NULL or ctx.heap == NULL):
+            raise MemoryError()
+
+        for slot in range(slots):
+            ctx.limits[slot] = counts[slot]
+        for index in range(ctx.members):
+            resistance, used = entries[index]
+            ctx.resistances[index] = resistance
+            ctx.sizes[index] = sum(used)
+            for slot in range(slots):
+                ctx.used[index * slots + slot] = used[slot]
+
+        _extend(&ctx, 0, 1, 0.0, 0, payload, member_used)
+
+        # Empty the heap worst-first, then reverse to get the best hit first
+        best = []
+        while ctx.held:
+            best.append(payload[ctx.heap[0].slot])
+            ctx.held -= 1
+            ctx.heap[0] = ctx.heap[ctx.held]
+            _sift_down(ctx.heap, ctx.held, 0)
+        best.reverse()
+    finally:
+        free(ctx.resistances)
+        free(ctx.sizes)
+        free(ctx.used)
+        free(ctx.limits)
+        free(ctx.usage)
+        free(ctx.group)
+        free(ctx.heap)
+
+    return best
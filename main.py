@@ -1,42 +1,74 @@
-from itertools import combinations, chain
-from typing import List, Tuple, Dict, Union
+from itertools import chain
+from typing import List, Tuple, Dict, Iterator, Optional, Set, Union
 import math
 from dataclasses import dataclass
 from enum import Enum
 from collections import Counter
+from functools import lru_cache
 import argparse
+from array import array
+import heapq
+from bisect import bisect_left
 
+try:
+    # Optional compiled kernel, built with `cythonize -i circuit_kernel.pyx`
+    from circuit_kernel import search as _compiled_search
+except ImportError:
+    _compiled_search = None
+
+SCALES = [1e12, 1e9, 1e6, 1e3, 1, 1e-3, 1e-6, 1e-9, 1e-12]
+PREFIXES = ['T', 'G', 'M', 'k', '', 'm', 'µ', 'n', 'p']
+
+@lru_cache(maxsize=1024)
 def format_resistance(value: float) -> str:
     """Convert resistance value to human readable format with proper scale"""
-    scales = [
-        (1e12, 'T'), (1e9, 'G'), (1e6, 'M'), (1e3, 'k'),
-        (1, ''), (1e-3, 'm'), (1e-6, 'µ'), (1e-9, 'n'), (1e-12, 'p')
-    ]
-    
-    for scale, prefix in scales:
-        if value >= scale or scale == 1e-12:
-            scaled = value / scale
-            if abs(scaled) >= 100:
-                # For values >= 100, still show decimals for k/M/G/T scales
-                if prefix in ['k', 'M', 'G', 'T']:
-                    return f"{scaled:.2f}{prefix}"
-                return f"{scaled:.0f}{prefix}" if scaled.is_integer() else f"{scaled:.2f}{prefix}"
-            else:
-                return f"{scaled:.2f}{prefix}"
+    if value >= SCALES[0]:
+        idx = 0
+    elif value > 0:
+        # Every scale covers three decades, starting at the '' scale (index 4)
+        idx = min(len(SCALES) - 1, 4 - math.floor(math.log10(value)) // 3)
+        # log10 can round across a decade boundary, so settle on the exact scale
+        if idx < len(SCALES) - 1 and value < SCALES[idx]:
+            idx += 1
+        elif idx > 0 and value >= SCALES[idx - 1]:
+            idx -= 1
+    else:
+        idx = len(SCALES) - 1
     
-    return f"{value:.2f}"
+    scale, prefix = SCALES[idx], PREFIXES[idx]
+    scaled = value / scale
+    if abs(scaled) >= 100:
+        # For values >= 100, still show decimals for k/M/G/T scales
+        if prefix in ['k', 'M', 'G', 'T']:
+            return f"{scaled:.2f}{prefix}"
+        return f"{scaled:.0f}{prefix}" if scaled.is_integer() else f"{scaled:.2f}{prefix}"
+    else:
+        return f"{scaled:.2f}{prefix}"
 
 class ConnectionType(Enum):
     SERIES = "series"
     PARALLEL = "parallel"
     MIXED = "mixed"
 
-@dataclass
+@dataclass(frozen=True)
 class Circuit:
-    resistors: List[List[int]]  # List of resistor chains
+    # _key caches the comparison key; it has a slot but is not a dataclass field
+    __slots__ = ('resistors', 'total_resistance', 'connection_type', '_key')
+    
+    resistors: Tuple[Tuple[int, ...], ...]  # Resistor chains, each sorted, in sorted order
     total_resistance: float
     connection_type: ConnectionType
     
+    def __post_init__(self):
+        # Canonicalize once so comparisons and hashing don't have to re-sort
+        branches = tuple(sorted(tuple(sorted(branch)) for branch in self.resistors))
+        object.__setattr__(self, 'resistors', branches)
+        object.__setattr__(self, '_key', (branches, self.connection_type))
+    
+    def __reduce__(self):
+        # Frozen slots can't be restored by pickle's default setattr, so rebuild instead
+        return (Circuit, (self.resistors, self.total_resistance, self.connection_type))
+    
     def __str__(self):
         return f"Circuit(R={format_resistance(self.total_resistance)}Ω, type={self.connection_type.value})"
     
@@ -44,90 +76,168 @@ class Circuit:
         if not isinstance(other, Circuit):
             return False
         
-        if self.connection_type != other.connection_type:
-            return False
-        
-        if abs(self.total_resistance - other.total_resistance) > 1e-10:
-            return False
-        
-        # Sort branches internally and then sort all branches for comparison
-        self_branches = [sorted(branch) for branch in self.resistors]
-        other_branches = [sorted(branch) for branch in other.resistors]
-        
-        return sorted(self_branches) == sorted(other_branches)
+        return self._key == other._key and abs(self.total_resistance - other.total_resistance) <= 1e-10
     
     def __hash__(self):
-        # Create a hashable representation of the circuit
-        branches = tuple(tuple(sorted(branch)) for branch in sorted(self.resistors))
-        return hash((branches, self.connection_type))
+        return hash(self._key)
 
 def parallel_resistance(resistances: List[float]) -> float:
     """Calculate equivalent resistance for parallel connection."""
     if not resistances:
         return 0
-    return 1 / sum(1/r for r in resistances)
+    first = resistances[0]
+    if all(r == first for r in resistances):
+        # Identical resistors in parallel, common when using several of one value
+        return first / len(resistances)
+    return 1 / math.fsum(1/r for r in resistances)
 
 def series_resistance(resistances: List[float]) -> float:
     """Calculate equivalent resistance for series connection."""
     return sum(resistances)
 
-def generate_resistor_combinations(available_resistors: List[Tuple[int, int]]) -> List[List[int]]:
+def generate_resistor_combinations(available_resistors: List[Tuple[int, int]],
+                                   target_resistance: Optional[float] = None,
+                                   tolerance_percent: float = 5.0) -> List[List[int]]:
     """
     Generate all possible resistor combinations from available resistors.
     
     Args:
         available_resistors: List of tuples (resistance_value, count)
+        target_resistance: If given, drop combinations that cannot be part of
+            any circuit within tolerance_percent of it
+        tolerance_percent: Tolerance used with target_resistance
     Returns:
         List of unique resistor combinations
     """
-    result = []
+    seen: Set[Tuple[int, ...]] = set()
+    limits = dict(available_resistors)
     
-    def is_valid_combination(combo: List[int]) -> bool:
+    def is_valid_combination(counts: Counter) -> bool:
         """Check if combination uses allowed number of each resistor value"""
-        counts = Counter(combo)
-        for value, max_count in available_resistors:
-            if counts[value] > max_count:
-                return False
-        return True
+        return not any(counts[value] > limits[value] for value in counts)
+    
+    if target_resistance is not None:
+        tolerance = target_resistance * (tolerance_percent / 100)
+        lower, upper = target_resistance - tolerance, target_resistance + tolerance
+        # Adding parallel branches can only lower the total, at best down to
+        # having every available resistor in a branch of its own
+        all_inverse = sum(count / value for value, count in available_resistors if count > 0)
+    
+    def is_useful(combo: Tuple[int, ...]) -> bool:
+        """Check if combination could be part of a circuit within tolerance"""
+        if target_resistance is None:
+            return True
+        # A series chain below the window only gets lower once put in parallel
+        total = series_resistance(combo)
+        return total >= lower and 1 / (1 / total + all_inverse) <= upper
     
     # First, generate single-value combinations
     for value, count in available_resistors:
         for i in range(1, count + 1):
-            combo = [value] * i
-            if combo not in result:
-                result.append(combo)
+            combo = (value,) * i
+            if is_useful(combo):
+                seen.add(combo)
     
     # Generate mixed combinations (only combine pairs of single resistors)
-    base_combinations = []
-    for value, _ in available_resistors:
-        base_combinations.append([value])
+    values = [value for value, _ in available_resistors]
+    for i in range(len(values)):
+        for j in range(i + 1, len(values)):
+            key = tuple(sorted((values[i], values[j])))
+            if key not in seen and is_valid_combination(Counter(key)) and is_useful(key):
+                seen.add(key)
     
-    for i in range(len(base_combinations)):
-        for j in range(i + 1, len(base_combinations)):
-            combined = sorted(base_combinations[i] + base_combinations[j])
-            if is_valid_combination(combined) and combined not in result:
-                result.append(combined)
+    return sorted(list(key) for key in seen)
+
+def _combination_indices(n: int, k: int) -> Iterator[Tuple[array, int]]:
+    """
+    Yield k-combinations of range(n) in lexicographic order.
     
-    return sorted(result)
+    The same index array is mutated in place and yielded every time, together
+    with the first position that changed since the previous combination.
+    """
+    if k > n:
+        return
+    indices = array('i', range(k))
+    changed = 0
+    while True:
+        yield indices, changed
+        changed = k - 1
+        while changed >= 0 and indices[changed] == n - k + changed:
+            changed -= 1
+        if changed < 0:
+            return
+        indices[changed] += 1
+        for i in range(changed + 1, k):
+            indices[i] = indices[i - 1] + 1
 
-def generate_circuits(resistor_combinations: List[List[int]], max_parallel_branches: int = 4) -> List[Circuit]:
-    """Generate all possible circuit configurations."""
+def generate_circuits(resistor_combinations: List[List[int]],
+                      max_parallel_branches: int = 4,
+                      target_resistance: Optional[float] = None,
+                      tolerance_percent: float = 5.0) -> List[Circuit]:
+    """
+    Generate all possible circuit configurations.
+    
+    If target_resistance is given, only circuits within tolerance_percent of it
+    are created.
+    """
     circuits = []
+    if target_resistance is None:
+        lower, upper = -math.inf, math.inf
+    else:
+        tolerance = target_resistance * (tolerance_percent / 100)
+        lower, upper = target_resistance - tolerance, target_resistance + tolerance
+    
+    # Branch resistances and their reciprocals are shared by every grouping
+    canonical = [tuple(sorted(combo)) for combo in resistor_combinations]
+    series_sums = [series_resistance(branch) for branch in canonical]
+    inverses = [1 / total for total in series_sums]
+    
+    # Canonical (branches, connection_type) keys of circuits already created,
+    # so duplicate combinations are skipped before a Circuit is built
+    seen_keys: Set[Tuple[Tuple[Tuple[int, ...], ...], ConnectionType]] = set()
     
     # Generate series circuits
-    for combo in resistor_combinations:
-        total_r = series_resistance(combo)
-        circuits.append(Circuit([combo], total_r, ConnectionType.SERIES))
+    for branch, total_r in zip(canonical, series_sums):
+        key = ((branch,), ConnectionType.SERIES)
+        if lower <= total_r <= upper and key not in seen_keys:
+            seen_keys.add(key)
+            circuits.append(Circuit(key[0], total_r, ConnectionType.SERIES))
     
     # Generate parallel circuits
     for n in range(2, max_parallel_branches + 1):
-        for combo in combinations(resistor_combinations, n):
-            if len(combo) <= max_parallel_branches:
-                total_r = parallel_resistance([series_resistance(branch) for branch in combo])
-                circuits.append(Circuit(list(combo), total_r, ConnectionType.PARALLEL))
+        # The first n - 1 branches come from an index array mutated in place,
+        # with prefix[i] holding the reciprocal sum of the first i of them, so
+        # only positions that changed are recomputed; the last branch is a
+        # plain loop over the remaining indices
+        prefix = [0.0] * n
+        for head, changed in _combination_indices(len(inverses) - 1, n - 1):
+            for i in range(changed, n - 1):
+                prefix[i + 1] = prefix[i] + inverses[head[i]]
+            head_inverse = prefix[n - 1]
+            for last in range(head[-1] + 1, len(inverses)):
+                total_r = 1 / (head_inverse + inverses[last])
+                if lower <= total_r <= upper:
+                    key = (tuple(sorted(canonical[i] for i in (*head, last))), ConnectionType.PARALLEL)
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    circuits.append(Circuit(key[0], total_r, ConnectionType.PARALLEL))
     
     return circuits
 
+@lru_cache(maxsize=256)
+def _format_resistor_value(value: float) -> str:
+    """Special formatting for resistor values in the circuit diagram"""
+    if value >= 100 and value.is_integer():
+        return f"{int(value)}"  # No decimal places for large whole numbers
+    else:
+        return format_resistance(value)  # Use standard formatting for other cases
+
+@lru_cache(maxsize=256)
+def _resistor_suffix(value: float) -> str:
+    """Part of a resistor label that follows its number, e.g. ' 470Ω]'"""
+    return f" {_format_resistor_value(value)}Ω]"
+
 class CircuitAsciiDrawer:
     def __init__(self, width=120):
         self.width = width
@@ -140,26 +250,20 @@ class CircuitAsciiDrawer:
     
     def format_resistor_value(self, value: float) -> str:
         """Special formatting for resistor values in the circuit diagram"""
-        if value >= 100 and value.is_integer():
-            return f"{int(value)}"  # No decimal places for large whole numbers
-        else:
-            return format_resistance(value)  # Use standard formatting for other cases
+        return _format_resistor_value(value)
     
     def create_resistor_string(self, value: float) -> str:
         """Creates a resistor representation with unique number and scaled value"""
         r_num = self.next_resistor_number()
-        value_str = self.format_resistor_value(value)
-        return f"[R{r_num} {value_str}Ω]"
+        return f"[R{r_num}" + _resistor_suffix(value)
 
     def add_line(self, content: str, y: int, x: int = 0):
+        # Rows are kept as character lists and only joined once in draw_circuit
         while len(self.lines) <= y:
-            self.lines.append(" " * self.width)
-        current = list(self.lines[y])
-        for i, char in enumerate(content):
-            pos = x + i
-            if pos < self.width:
-                current[pos] = char
-        self.lines[y] = "".join(current)
+            self.lines.append([" "] * self.width)
+        end = min(x + len(content), self.width)
+        if end > x:
+            self.lines[y][x:end] = content[:end - x]
 
     def draw_parallel(self, branches: List[List[int]], start_x: int, y: int) -> int:
         branch_count = len(branches)
@@ -195,12 +299,13 @@ class CircuitAsciiDrawer:
             current_x = start_x + 1
             
             # Draw resistors in series for this branch
-            for j, resistor in enumerate(branch):
-                r_str = self.create_resistor_string(float(resistor))
+            floats = list(map(float, branch))
+            for j, value in enumerate(floats):
+                r_str = self.create_resistor_string(value)
                 self.add_line("─" + r_str + "─", branch_y, current_x)
                 current_x += len(r_str) + 2
                 
-                if j < len(branch) - 1:
+                if j < len(floats) - 1:
                     self.add_line("─", branch_y, current_x)
                     current_x += 1
             
@@ -229,13 +334,14 @@ class CircuitAsciiDrawer:
 
     def draw_series(self, resistors: List[int], start_x: int, y: int) -> int:
         current_x = start_x
+        floats = list(map(float, resistors))
         
-        for i, resistor in enumerate(resistors):
-            r_str = self.create_resistor_string(float(resistor))
+        for i, value in enumerate(floats):
+            r_str = self.create_resistor_string(value)
             self.add_line("─" + r_str + "─", y, current_x)
             current_x += len(r_str) + 2
             
-            if i < len(resistors) - 1:
+            if i < len(floats) - 1:
                 self.add_line("─", y, current_x)
                 current_x += 1
         
@@ -262,7 +368,8 @@ class CircuitAsciiDrawer:
         self.add_line("───> output", center_y, end_x)
         
         # Add empty lines above and below
-        final_art = [" " * self.width] * 2 + self.lines + [" " * self.width] * 2
+        rows = ["".join(row) for row in self.lines]
+        final_art = [" " * self.width] * 2 + rows + [" " * self.width] * 2
         return "\n".join(line.rstrip() for line in final_art)
 
 def draw_circuit(circuit: Circuit) -> str:
@@ -270,54 +377,189 @@ def draw_circuit(circuit: Circuit) -> str:
     drawer = CircuitAsciiDrawer()
     return drawer.draw_circuit(circuit)
 
+def _search_kernel(values: List[float],
+                   counts: List[int],
+                   target: float,
+                   tolerance: float,
+                   max_branches: int,
+                   max_results: int,
+                   prioritize_fewer_components: bool = False) -> List[Tuple[float, int, Tuple[Tuple[int, ...], ...]]]:
+    """
+    Find the best series and parallel circuits within tolerance of the target.
+    
+    Returns up to max_results (resistance, component_count, branches) hits, best
+    first, where each branch is encoded as the number of resistors of each value
+    it uses. Hits rank by deviation, or by component count and then deviation;
+    ties keep the order in which they were found.
+    """
+    lower = target - tolerance
+    upper = target + tolerance
+    if upper <= 0 or max_results <= 0:
+        return []
+    
+    # Series branches, as the number of resistors of each value they use
+    branches: Set[Tuple[int, ...]] = set()
+    frontier = {tuple(0 for _ in values)}
+    while frontier:
+        grown_frontier = set()
+        for used in frontier:
+            for slot in range(len(values)):
+                if used[slot] >= counts[slot]:
+                    continue
+                grown = used[:slot] + (used[slot] + 1,) + used[slot + 1:]
+                if grown not in branches:
+                    branches.add(grown)
+                    grown_frontier.add(grown)
+        frontier = grown_frontier
+    
+    # A parallel circuit is always below its smallest branch, so branches under
+    # the lower bound can never take part in a match
+    members = []
+    for used in branches:
+        resistance = sum(count * value for count, value in zip(used, values))
+        if resistance >= lower:
+            members.append((resistance, used))
+    members.sort()
+    resistances = [resistance for resistance, _ in members]
+    sizes = [sum(used) for _, used in members]
+    
+    # Usage is packed into one integer with a field per resistor value. Each
+    # field has a spare top bit that absorbs the borrow when subtracting usage
+    # from the limits, so a single subtraction checks every value at once.
+    field_bits = max(counts, default=0).bit_length() + 1
+    guard = sum(1 << (slot * field_bits + field_bits - 1) for slot in range(len(values)))
+    limits = guard | sum(count << (slot * field_bits) for slot, count in enumerate(counts))
+    packed = [sum(count << (slot * field_bits) for slot, count in enumerate(used)) for _, used in members]
+    
+    # Branches that still fit, keyed by the usage of the group built so far
+    fitting: Dict[int, array] = {}
+    
+    # The best hits so far as a heap of negated (components, deviation, order)
+    # keys, so the worst of them is always at the top
+    held = []
+    found = 0
+    max_components = math.inf
+    
+    def record(total_r: float, components: int, group: Tuple[int, ...]):
+        """Keep a hit if it ranks among the best max_results so far"""
+        nonlocal found, lower, upper, max_components
+        deviation = abs(total_r - target)
+        rank = components if prioritize_fewer_components else 0
+        found += 1
+        if len(held) == max_results:
+            # A later hit only displaces one that ranks strictly worse
+            if (rank, deviation) >= (-held[0][0], -held[0][1]):
+                return
+            heapq.heappop(held)
+        hit = (total_r, components, tuple(members[i][1] for i in group))
+        heapq.heappush(held, (-rank, -deviation, -found, hit))
+        
+        if len(held) == max_results:
+            # Nothing worse than the current worst can make it in any more, so
+            # the search window narrows to what can still beat it
+            if prioritize_fewer_components:
+                max_components = -held[0][0]
+            else:
+                worst = -held[0][1]
+                lower, upper = target - worst, target + worst
+    
+    def extend(start: int, depth: int, inverse: float, group: Tuple[int, ...], usage: int, components: int):
+        """Add branches in ascending resistance order so each group is visited once"""
+        remaining = max_branches - depth
+        if inverse and lower > 0:
+            # Skip straight past branches that would pull the group below the window
+            headroom = 1 / lower - inverse
+            if headroom <= 0:
+                return
+            start = max(start, bisect_left(resistances, (1 - 1e-12) / headroom))
+        
+        candidates = fitting.get(usage)
+        if candidates is None:
+            spare = limits - usage
+            candidates = fitting[usage] = array('i', [
+                index for index, branch in enumerate(packed) if (spare - branch) & guard == guard
+            ])
+        
+        for position in range(bisect_left(candidates, start), len(candidates)):
+            index = candidates[position]
+            resistance = resistances[index]
+            total_inverse = inverse + 1 / resistance
+            # Later branches are larger, so if even the best completion
+            # of this group stays above the window, so do all the rest
+            if total_inverse + remaining / resistance < 1 / upper:
+                break
+            total_r = 1 / total_inverse
+            if total_r < lower:
+                continue
+            # Components only grow as the group is extended
+            total_components = components + sizes[index]
+            if total_components > max_components:
+                continue
+            
+            if total_r <= upper:
+                record(total_r, total_components, group + (index,))
+            if remaining and lower < total_r:
+                # Only descend if some branch is large enough to keep the group
+                # above the window yet small enough to bring it down into it
+                smallest = resistance
+                if lower > 0:
+                    gap = 1 / lower - total_inverse
+                    if gap <= 0:
+                        # Already on the lower edge, so any further branch drops below it
+                        continue
+                    smallest = max(smallest, (1 - 1e-12) / gap)
+                following = bisect_left(resistances, smallest)
+                slack = 1 / upper - total_inverse
+                if following < len(resistances) and (
+                        slack <= 0 or resistances[following] * slack <= remaining * (1 + 1e-12)):
+                    extend(index, depth + 1, total_inverse, group + (index,), usage + packed[index],
+                           total_components)
+    
+    extend(0, 1, 0.0, (), 0, 0)
+    
+    return [entry[3] for entry in sorted(held, reverse=True)]
+
 def find_best_circuits(available_resistors: List[Tuple[int, int]], 
                       target_resistance: float,
                       tolerance_percent: float = 5.0,
                       max_results: int = 5,
-                      prioritize_fewer_components: bool = False) -> List[Tuple[Circuit, float]]:
+                      prioritize_fewer_components: bool = False,
+                      max_parallel_branches: int = 4) -> List[Tuple[Circuit, float]]:
     """
     Find the best circuits that match the target resistance within tolerance.
-    """
-    resistor_combinations = generate_resistor_combinations(available_resistors)
-    all_circuits = set()  # Use a set to automatically remove duplicates
-    
-    # Generate circuits with component count validation
-    for combo in resistor_combinations:
-        # Validate series circuits
-        circuit = Circuit([combo], series_resistance(combo), ConnectionType.SERIES)
-        all_circuits.add(circuit)
-        
-        # Generate parallel combinations that respect component limits
-        for n in range(2, min(5, len(resistor_combinations) + 1)):
-            for parallel_combo in combinations(resistor_combinations, n):
-                # Check if the total component count is valid
-                total_used = Counter(chain(*parallel_combo))
-                valid = True
-                for value, count in available_resistors:
-                    if total_used[value] > count:
-                        valid = False
-                        break
-                
-                if valid:
-                    total_r = parallel_resistance([series_resistance(branch) for branch in parallel_combo])
-                    circuit = Circuit(list(parallel_combo), total_r, ConnectionType.PARALLEL)
-                    all_circuits.add(circuit)
     
+    Circuits are composed bottom-up: series branches grow one resistor at a time
+    and parallel groups grow one branch at a time, so partial circuits that
+    exceed the available counts or can no longer reach the tolerance window are
+    dropped before they are extended.
+    """
+    # The same value may be listed more than once, e.g. `100:2 100:3` on the command line
+    limits = Counter()
+    for value, count in available_resistors:
+        limits[value] += count
+    values = list(limits)
+    counts = list(limits.values())
     tolerance = target_resistance * (tolerance_percent / 100)
-    matching_circuits = []
-    
-    for circuit in all_circuits:
-        deviation = abs(circuit.total_resistance - target_resistance)
-        if deviation <= tolerance:
-            total_components = sum(len(branch) for branch in circuit.resistors)
-            matching_circuits.append((circuit, deviation, total_components))
     
-    if prioritize_fewer_components:
-        matching_circuits.sort(key=lambda x: (x[2], x[1]))
+    if _compiled_search is not None:
+        hits = _compiled_search(array('d', values), array('l', counts), target_resistance, tolerance,
+                                max_parallel_branches, max_results, prioritize_fewer_components)
     else:
-        matching_circuits.sort(key=lambda x: x[1])
+        hits = _search_kernel(values, counts, target_resistance, tolerance, max_parallel_branches,
+                              max_results, prioritize_fewer_components)
+    
+    # Only the selected hits are turned into Circuit objects
+    best_circuits = []
+    for total_r, _, group in hits:
+        circuit_branches = tuple(
+            tuple(chain.from_iterable([value] * count for value, count in zip(values, used)))
+            for used in group
+        )
+        connection_type = ConnectionType.SERIES if len(group) == 1 else ConnectionType.PARALLEL
+        circuit = Circuit(circuit_branches, total_r, connection_type)
+        best_circuits.append((circuit, abs(total_r - target_resistance)))
     
-    return [(circuit, deviation) for circuit, deviation, _ in matching_circuits[:max_results]]
+    return best_circuits
 
 def main():
     parser = argparse.ArgumentParser(description="Find optimal resistor circuits for a target resistance.")
@@ -1,6 +1,9 @@
 import unittest
 from typing import List, Tuple
 from itertools import chain
+from array import array
+import dataclasses
+import pickle
 
 # Import all functions from the main module
 # Assuming the main code is in a file called resistor_circuit.py
@@ -13,6 +16,8 @@ from main import (
     find_best_circuits,
     Circuit,
     ConnectionType,
+    _compiled_search,
+    _search_kernel,
 )
 
 class TestResistorCircuit(unittest.TestCase):
@@ -44,6 +49,7 @@ class TestResistorCircuit(unittest.TestCase):
             ([100, 200, 400], 57.14285714285714),  # Three different resistors
             ([1000], 1000),  # Single resistor
             ([100, 100, 100, 100], 25),  # Four equal resistors
+            ([300, 300, 300], 100),  # Three equal resistors
         ]
         
         for resistors, expected in test_cases:
@@ -82,6 +88,24 @@ class TestResistorCircuit(unittest.TestCase):
         for combo in expected:
             self.assertIn(combo, combinations)
 
+    def test_generate_resistor_combinations_pruned(self):
+        """Test that combinations which cannot reach the target are dropped"""
+        available_resistors = [(100, 3), (1000, 1)]
+        combinations = generate_resistor_combinations(
+            available_resistors, target_resistance=300, tolerance_percent=5
+        )
+        
+        # Too small to reach 285Ω even on their own
+        self.assertNotIn([100], combinations)
+        self.assertNotIn([100, 100], combinations)
+        # Still usable in series or as a parallel branch
+        self.assertIn([100, 100, 100], combinations)
+        self.assertIn([100, 1000], combinations)
+        
+        all_circuits = generate_circuits(generate_resistor_combinations(available_resistors), 4, 300, 5)
+        pruned_circuits = generate_circuits(combinations, 4, 300, 5)
+        self.assertEqual(set(all_circuits), set(pruned_circuits))
+
     def test_generate_circuits(self):
         """Test circuit generation with various configurations"""
         resistor_combinations = [[100], [200], [100, 100]]
@@ -107,6 +131,49 @@ class TestResistorCircuit(unittest.TestCase):
                 expected = parallel_resistance(branches)
                 self.assertAlmostEqual(circuit.total_resistance, expected, places=2)
 
+    def test_find_best_circuits_bounded_search(self):
+        """Test that narrowing the search to the best results finds the same circuits"""
+        available_resistors = [(47, 4), (100, 4), (470, 4)]
+        
+        for prioritize in (False, True):
+            with self.subTest(prioritize=prioritize):
+                everything = find_best_circuits(available_resistors, 150, 10, max_results=10**6,
+                                                prioritize_fewer_components=prioritize)
+                best = find_best_circuits(available_resistors, 150, 10, max_results=5,
+                                          prioritize_fewer_components=prioritize)
+                self.assertGreater(len(everything), 5)
+                self.assertEqual(best, everything[:5])
+
+    def test_find_best_circuits_bounded_search_wide_tolerance(self):
+        """Test that a window narrowed onto a group's exact resistance does not break the search"""
+        available_resistors = [(150, 3), (10, 4)]
+        
+        everything = find_best_circuits(available_resistors, 200, 100, max_results=10**6)
+        best = find_best_circuits(available_resistors, 200, 100)
+        self.assertEqual(len(best), 5)
+        self.assertEqual(best, everything[:5])
+        self.assertEqual(best[0][0].resistors, ((10, 10, 10, 10, 150),))
+
+    def test_generate_circuits_within_tolerance(self):
+        """Test that a target restricts generated circuits to the tolerance window"""
+        resistor_combinations = [[100], [200], [100, 100], [100, 200]]
+        circuits = generate_circuits(resistor_combinations, target_resistance=100, tolerance_percent=10)
+        
+        self.assertGreater(len(circuits), 0)
+        for circuit in circuits:
+            self.assertLessEqual(abs(circuit.total_resistance - 100), 10)
+        
+        all_circuits = generate_circuits(resistor_combinations)
+        expected = [c for c in all_circuits if abs(c.total_resistance - 100) <= 10]
+        self.assertEqual(circuits, expected)
+
+    def test_generate_circuits_duplicates(self):
+        """Test that duplicate combinations yield each circuit only once"""
+        circuits = generate_circuits([[100, 200], [200, 100], [300]], max_parallel_branches=3)
+        
+        self.assertEqual(len(circuits), len(set(circuits)))
+        self.assertEqual(len(circuits), 5)  # Two series, three parallel
+
     def test_find_best_circuits(self):
         """Test finding best circuits for given target resistance"""
         available_resistors = [(100, 3), (220, 2)]  # Three 100Ω and two 220Ω
@@ -152,6 +219,64 @@ class TestResistorCircuit(unittest.TestCase):
                     for resistor in branch:
                         self.assertIn(resistor, valid_values)
 
+    def test_find_best_circuits_exact_match(self):
+        """Test that identical branches can be combined in parallel"""
+        circuits = find_best_circuits([(100, 2)], 50, tolerance_percent=1)
+        
+        self.assertEqual(len(circuits), 1)
+        circuit, deviation = circuits[0]
+        self.assertEqual(circuit.connection_type, ConnectionType.PARALLEL)
+        self.assertEqual(circuit.resistors, ((100,), (100,)))
+        self.assertAlmostEqual(deviation, 0)
+
+    def test_find_best_circuits_duplicate_values(self):
+        """Test that counts of a value listed more than once are added up"""
+        circuits = find_best_circuits([(100, 2), (100, 3)], 500, tolerance_percent=1)
+
+        self.assertEqual(len(circuits), 1)
+        circuit, deviation = circuits[0]
+        self.assertEqual(circuit.connection_type, ConnectionType.SERIES)
+        self.assertEqual(circuit.resistors, ((100, 100, 100, 100, 100),))
+        self.assertAlmostEqual(deviation, 0)
+
+    def test_circuit_canonical_form(self):
+        """Test that circuits compare equal regardless of resistor order"""
+        a = Circuit(((220, 100), (100,)), 76.74, ConnectionType.PARALLEL)
+        b = Circuit(((100,), (100, 220)), 76.74, ConnectionType.PARALLEL)
+        
+        self.assertEqual(a.resistors, ((100,), (100, 220)))
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, Circuit(((100, 100, 220),), 76.74, ConnectionType.SERIES))
+
+    def test_circuit_fields(self):
+        """Test that the cached comparison key stays out of the public fields"""
+        circuit = Circuit(((220, 100), (100,)), 76.74, ConnectionType.PARALLEL)
+        
+        self.assertEqual([f.name for f in dataclasses.fields(circuit)],
+                         ['resistors', 'total_resistance', 'connection_type'])
+        self.assertNotIn('_key', dataclasses.asdict(circuit))
+        self.assertFalse(hasattr(circuit, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(circuit)), circuit)
+
+    @unittest.skipIf(_compiled_search is None, "compiled circuit_kernel is not built")
+    def test_compiled_kernel_matches_python(self):
+        """Test that the compiled kernel returns the same hits as the Python one"""
+        cases = [
+            ([100, 220, 470, 47], [3, 2, 2, 3], 150, 15, 4),
+            ([100, 220, 470, 47], [3, 2, 2, 3], 333, 5, 3),
+            ([100, 220, 470, 47], [3, 2, 2, 3], 1000, 50, 2),
+            ([4.7, 10], [2, 1], 3.2, 0.16, 4),
+        ]
+        for values, counts, target, tolerance, max_branches in cases:
+            for max_results, prioritize in [(5, False), (3, True), (1000, False)]:
+                with self.subTest(target=target, max_results=max_results, prioritize=prioritize):
+                    expected = _search_kernel(values, counts, target, tolerance, max_branches,
+                                              max_results, prioritize)
+                    result = _compiled_search(array('d', values), array('l', counts), target, tolerance,
+                                              max_branches, max_results, prioritize)
+                    self.assertEqual(result, expected)
+
     def test_edge_cases(self):
         """Test edge cases and potential error conditions"""
         # Test empty resistor list